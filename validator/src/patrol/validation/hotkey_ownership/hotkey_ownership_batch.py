@@ -62,10 +62,14 @@ class HotkeyOwnershipBatch:
 
         random.shuffle(miners)
 
+        # One round-trip for the whole batch instead of one query per miner.
+        score_cache = await self.challenge.prefetch_previous_scores(miners)
+
         async def challenge(miner):
             try:
                 async with self.concurrency_semaphore:
-                    await self.challenge.execute_challenge(miner, miner_target_hotkeys[miner.uid], batch_id, max_block_number)
+                    await self.challenge.execute_challenge(miner, miner_target_hotkeys[miner.uid], batch_id, max_block_number,
+                                                           score_cache=score_cache)
             except Exception as ex:
                 logger.exception("Unhandled error: %s", ex)
 
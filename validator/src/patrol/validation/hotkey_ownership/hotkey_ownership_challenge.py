@@ -2,7 +2,6 @@ import asyncio
 import dataclasses
 import logging
 from datetime import datetime, UTC
-import itertools
 import uuid
 from typing import Optional
 from uuid import UUID
@@ -13,14 +12,16 @@ from patrol.validation.dashboard import DashboardClient
 from patrol.validation.hotkey_ownership.hotkey_ownership_miner_client import HotkeyOwnershipMinerClient, \
     MinerTaskException
 
-import networkx as nx
-
 from patrol.validation.hotkey_ownership.hotkey_ownership_scoring import HotkeyOwnershipScoring
 from patrol.validation.scoring import MinerScore, MinerScoreRepository
 from patrol_common.protocol import HotkeyOwnershipSynapse, Node, Edge
 
 logger = logging.getLogger(__name__)
 
+# dataclasses.asdict deep-copies the whole score on every log call; a flat
+# getattr over the field names is all the log handlers need.
+_SCORE_FIELDS = tuple(field.name for field in dataclasses.fields(MinerScore))
+
 
 class HotkeyOwnershipValidator:
 
@@ -41,28 +42,44 @@ class HotkeyOwnershipValidator:
         if not subgraph.nodes:
             raise ValidationException("Zero nodes")
 
-        graph = nx.MultiDiGraph()
+        nodes: set[str] = set()
         for node in subgraph.nodes:
-            if node.id in graph:
+            if node.id in nodes:
                 raise ValidationException(f"Duplicate node [{node.id}]")
-            graph.add_node(node.id)
-
+            nodes.add(node.id)
+
+        # Union-find over the node ids; after merging every edge's endpoints, weak
+        # connectivity means all nodes share a single root. This avoids building a
+        # full nx.MultiDiGraph (with its per-edge dicts) just for these checks.
+        parent = {node_id: node_id for node_id in nodes}
+
+        def find(node_id: str) -> str:
+            root = node_id
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node_id] != root:
+                parent[node_id], node_id = root, parent[node_id]
+            return root
+
+        edges_seen: set[tuple[str, str, int]] = set()
         for edge in subgraph.edges:
             if edge.coldkey_source == edge.coldkey_destination:
                 raise ValidationException("Edge has same source and destination")
 
-            if edge.coldkey_source not in graph.nodes:
+            if edge.coldkey_source not in nodes:
                 raise ValidationException(f'Edge source [{edge.coldkey_source}] is not a node')
 
-            if edge.coldkey_destination not in graph.nodes:
+            if edge.coldkey_destination not in nodes:
                 raise ValidationException(f"Edge destination [{edge.coldkey_destination}] is not a node")
 
-            if graph.has_edge(edge.coldkey_source, edge.coldkey_destination, key=edge.evidence.effective_block_number):
+            edge_key = (edge.coldkey_source, edge.coldkey_destination, edge.evidence.effective_block_number)
+            if edge_key in edges_seen:
                 raise ValidationException(f"Duplicate edge (from={edge.coldkey_source}, to={edge.coldkey_destination}, block={edge.evidence.effective_block_number})")
+            edges_seen.add(edge_key)
 
-            graph.add_edge(edge.coldkey_source, edge.coldkey_destination, key=edge.evidence.effective_block_number)
+            parent[find(edge.coldkey_source)] = find(edge.coldkey_destination)
 
-        if not nx.is_weakly_connected(graph):
+        if len({find(node_id) for node_id in nodes}) > 1:
             raise ValidationException("Graph is not fully connected")
 
     async def _validate_start_end_ownership(self, hotkey: str, nodes: list[Node], max_block_number: int):
@@ -70,27 +87,42 @@ class HotkeyOwnershipValidator:
         start_owner = await self.chain_reader.get_hotkey_owner(hotkey, Constants.LOWER_BLOCK_LIMIT)
         end_owner = await self.chain_reader.get_hotkey_owner(hotkey, max_block_number)
 
+        node_ids = {node.id for node in nodes}
+
         # check that the start owner is in the graph
-        if start_owner not in [node.id for node in nodes]:
+        if start_owner not in node_ids:
             raise ValidationException(f"Start owner [{start_owner}] is not in the graph")
 
         # check that the end owner is in the graph
-        if end_owner not in [node.id for node in nodes]:
+        if end_owner not in node_ids:
             raise ValidationException(f"End owner [{end_owner}] is not in the graph")
 
     async def _validate_edges(self, hotkey: str, edges: list[Edge]):
 
-        async def chain_validation(block_number: int, expected_owning_coldkey: str):
-            actual_owner = await self.chain_reader.get_hotkey_owner(hotkey, block_number)
-            if actual_owner != expected_owning_coldkey:
-                raise ValidationException(f"Expected hotkey_owner [{expected_owning_coldkey}]; actual [{actual_owner}] for block [{block_number}]")
+        # Consecutive edges often reference adjacent blocks, so fetch each distinct
+        # block once, with bounded concurrency to avoid flooding the chain node.
+        needed_blocks = {
+            block_number
+            for e in edges
+            for block_number in (e.evidence.effective_block_number - 1, e.evidence.effective_block_number + 1)
+        }
+
+        semaphore = asyncio.Semaphore(16)
 
-        evidences = itertools.chain.from_iterable([
-            chain_validation(e.evidence.effective_block_number - 1, e.coldkey_source),
-            chain_validation(e.evidence.effective_block_number + 1, e.coldkey_destination),
-        ] for e in edges)
+        async def fetch_owner(block_number: int):
+            async with semaphore:
+                return block_number, await self.chain_reader.get_hotkey_owner(hotkey, block_number)
 
-        await asyncio.gather(*evidences)
+        owners = dict(await asyncio.gather(*(fetch_owner(b) for b in sorted(needed_blocks))))
+
+        for e in edges:
+            for block_number, expected_owning_coldkey in (
+                (e.evidence.effective_block_number - 1, e.coldkey_source),
+                (e.evidence.effective_block_number + 1, e.coldkey_destination),
+            ):
+                actual_owner = owners[block_number]
+                if actual_owner != expected_owning_coldkey:
+                    raise ValidationException(f"Expected hotkey_owner [{expected_owning_coldkey}]; actual [{actual_owner}] for block [{block_number}]")
 
 
 class HotkeyOwnershipChallenge:
@@ -109,7 +141,18 @@ class HotkeyOwnershipChallenge:
         self.dashboard_client = dashboard_client
         self.moving_average_denominator = 12
 
-    async def execute_challenge(self, miner: Miner, target_hotkey, batch_id: UUID, max_block_number: int):
+    async def prefetch_previous_scores(self, miners: list[Miner]) -> dict[tuple[str, int], list[float]]:
+        """
+        Fetch the previous scores for a whole batch of miners in a single query,
+        for passing into execute_challenge as score_cache.
+        """
+        return await self.score_repository.find_latest_overall_scores_bulk(
+            [(miner.axon_info.hotkey, miner.uid) for miner in miners],
+            TaskType.HOTKEY_OWNERSHIP,
+            self.moving_average_denominator - 1)
+
+    async def execute_challenge(self, miner: Miner, target_hotkey, batch_id: UUID, max_block_number: int,
+                                score_cache: Optional[dict[tuple[str, int], list[float]]] = None):
         task_id = uuid.uuid4()
         synapse = HotkeyOwnershipSynapse(
             batch_id=str(batch_id),
@@ -123,17 +166,17 @@ class HotkeyOwnershipChallenge:
 
             try:
                 await self.validator.validate(response, target_hotkey, max_block_number)
-                score = await self._calculate_score(batch_id, task_id, miner, response_time_seconds)
+                score = await self._calculate_score(batch_id, task_id, miner, response_time_seconds, score_cache)
             except ValidationException as ex:
                 error = str(ex)
-                score = await self._calculate_zero_score(batch_id, task_id, miner, response_time_seconds, error)
+                score = await self._calculate_zero_score(batch_id, task_id, miner, response_time_seconds, error, score_cache)
 
         except MinerTaskException as ex:
             error = str(ex)
-            score = await self._calculate_zero_score(batch_id, task_id, miner, 0, error)
+            score = await self._calculate_zero_score(batch_id, task_id, miner, 0, error, score_cache)
 
         await self.score_repository.add(score)
-        logger.info("Miner scored", extra=dataclasses.asdict(score))
+        logger.info("Miner scored", extra={name: getattr(score, name) for name in _SCORE_FIELDS})
 
         if self.dashboard_client:
             try:
@@ -144,11 +187,15 @@ class HotkeyOwnershipChallenge:
         return task_id
 
 
-    async def _moving_average(self, overall_score, miner: Miner):
-        previous_scores = list(await self.score_repository.find_latest_overall_scores(
-            (miner.axon_info.hotkey, miner.uid),
-            TaskType.HOTKEY_OWNERSHIP,
-            self.moving_average_denominator - 1))
+    async def _moving_average(self, overall_score, miner: Miner,
+                              score_cache: Optional[dict[tuple[str, int], list[float]]] = None):
+        if score_cache is not None:
+            previous_scores = list(score_cache.get((miner.axon_info.hotkey, miner.uid), []))
+        else:
+            previous_scores = list(await self.score_repository.find_latest_overall_scores(
+                (miner.axon_info.hotkey, miner.uid),
+                TaskType.HOTKEY_OWNERSHIP,
+                self.moving_average_denominator - 1))
         previous_scores.append(overall_score)
 
         denominator = self.moving_average_denominator
@@ -156,8 +203,9 @@ class HotkeyOwnershipChallenge:
 
         return sum(numerator_scores) / len(numerator_scores)
 
-    async def _calculate_zero_score(self, batch_id: uuid.UUID, task_id: UUID, miner: Miner, response_time: float, error_message: str) -> MinerScore:
-        moving_average = await self._moving_average(0, miner)
+    async def _calculate_zero_score(self, batch_id: uuid.UUID, task_id: UUID, miner: Miner, response_time: float,
+                                    error_message: str, score_cache=None) -> MinerScore:
+        moving_average = await self._moving_average(0, miner, score_cache)
         return MinerScore(
             id=task_id, batch_id=batch_id, created_at=datetime.now(UTC),
             uid=miner.uid,
@@ -175,9 +223,10 @@ class HotkeyOwnershipChallenge:
             task_type=TaskType.HOTKEY_OWNERSHIP
         )
 
-    async def _calculate_score(self, batch_id: UUID, task_id: UUID, miner: Miner, response_time: float) -> MinerScore:
+    async def _calculate_score(self, batch_id: UUID, task_id: UUID, miner: Miner, response_time: float,
+                               score_cache=None) -> MinerScore:
         score = self.scoring.score(True, response_time)
-        moving_average = await self._moving_average(score.overall, miner)
+        moving_average = await self._moving_average(score.overall, miner, score_cache)
         return MinerScore(
             id=task_id, batch_id=batch_id, created_at=datetime.now(UTC),
             uid=miner.uid,
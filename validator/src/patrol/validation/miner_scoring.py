@@ -1,7 +1,10 @@
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any
-import math
+from typing import Dict, Any, Optional
 import uuid
+
+import numpy as np
 from datetime import datetime, UTC
 from uuid import UUID
 
@@ -25,28 +28,64 @@ class MinerScoring:
         # Placeholder for future implementation
         return 0.0
 
+    def score_batch(self, volumes: np.ndarray, response_times: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized scoring for a batch of miners; returns
+        (volume_scores, responsiveness_scores, overall_scores) arrays.
+        """
+        volumes = np.asarray(volumes, dtype=np.float64)
+        response_times = np.asarray(response_times, dtype=np.float64)
+
+        # Sigmoid formula
+        volume_scores = 1 / (1 + np.exp(-Constants.STEEPNESS * (volumes - Constants.INFLECTION_POINT)))
+        responsiveness_scores = Constants.RESPONSE_TIME_HALF_SCORE / (response_times + Constants.RESPONSE_TIME_HALF_SCORE)
+
+        overall_scores = (
+            volume_scores * self.importance['volume']
+            + responsiveness_scores * self.importance['responsiveness']
+        )
+        return volume_scores, responsiveness_scores, overall_scores
+
     def calculate_volume_score(self, total_items: int) -> float:
         # Sigmoid formula
-        score = 1 / (1 + math.exp(-Constants.STEEPNESS * (total_items - Constants.INFLECTION_POINT)))
-        return score
+        return float(1 / (1 + np.exp(-Constants.STEEPNESS * (total_items - Constants.INFLECTION_POINT))))
 
     def calculate_responsiveness_score(self, response_time: float) -> float:
         return Constants.RESPONSE_TIME_HALF_SCORE / (response_time + Constants.RESPONSE_TIME_HALF_SCORE)
 
-    async def _moving_average(self, overall_score: float, miner: tuple[str, int]) -> float:
-        previous_scores = list(await self.miner_score_repository.find_latest_overall_scores(
-            miner,
-            TaskType.COLDKEY_SEARCH,
-            self.moving_average_denominator - 1
-        ))
+    async def _moving_average(
+            self,
+            overall_score: float,
+            miner: tuple[str, int],
+            score_cache: Optional[Dict[tuple[str, int], list[float]]] = None,
+    ) -> float:
+        if score_cache is not None:
+            previous_scores = list(score_cache.get(miner, []))
+        else:
+            previous_scores = list(await self.miner_score_repository.find_latest_overall_scores(
+                miner,
+                TaskType.COLDKEY_SEARCH,
+                self.moving_average_denominator - 1
+            ))
         previous_scores.append(overall_score)
-        numerator_scores = sorted(previous_scores, reverse=True)
 
+        # Only the top scores are summed, so take them directly rather than sorting.
         denominator = self.moving_average_denominator - NUMBER_OF_LOW_SCORES_TO_DISCARD
-        numerator_scores = numerator_scores[:denominator]
+        numerator_scores = heapq.nlargest(denominator, previous_scores)
 
         return sum(numerator_scores) / len(numerator_scores)
 
+    async def prefetch_previous_scores(self, miners: list[tuple[str, int]]) -> Dict[tuple[str, int], list[float]]:
+        """
+        Fetch the previous scores for a whole batch of miners in a single query,
+        for passing into calculate_score as score_cache.
+        """
+        return await self.miner_score_repository.find_latest_overall_scores_bulk(
+            miners,
+            TaskType.COLDKEY_SEARCH,
+            self.moving_average_denominator - 1
+        )
+
     async def calculate_score(
         self,
         uid: int,
@@ -55,10 +94,13 @@ class MinerScoring:
         validation_result: ValidationResult,
         response_time: float,
         batch_id: UUID,
+        score_cache: Optional[Dict[tuple[str, int], list[float]]] = None,
     ) -> MinerScore:
 
         if not validation_result.validated:
-            overall_score_moving_average = self._moving_average(0.0, (hotkey, uid))
+            # Schedule the lookup so the DB query runs concurrently with the logging,
+            # rather than holding an unawaited coroutine until the return statement.
+            moving_average_task = asyncio.create_task(self._moving_average(0.0, (hotkey, uid), score_cache))
 
             logger.warning(f"Zero score added to records for {uid}, reason: {validation_result.message}.")
             return MinerScore(
@@ -68,7 +110,7 @@ class MinerScoring:
                 uid=uid,
                 coldkey=coldkey,
                 hotkey=hotkey,
-                overall_score_moving_average=await overall_score_moving_average,
+                overall_score_moving_average=await moving_average_task,
                 overall_score=0.0,
                 volume_score=0.0,
                 volume=validation_result.volume,
@@ -80,16 +122,15 @@ class MinerScoring:
                 task_type=TaskType.COLDKEY_SEARCH
             )
 
-        volume_score = self.calculate_volume_score(validation_result.volume)
-        responsiveness_score = self.calculate_responsiveness_score(response_time)
-
-        overall_score = sum([
-            volume_score * self.importance["volume"],
-            responsiveness_score * self.importance["responsiveness"]
-        ])
+        volume_scores, responsiveness_scores, overall_scores = self.score_batch(
+            np.array([validation_result.volume]), np.array([response_time])
+        )
+        volume_score = float(volume_scores[0])
+        responsiveness_score = float(responsiveness_scores[0])
+        overall_score = float(overall_scores[0])
 
         logger.info(f"Scoring completed for miner {uid}, with overall score: {overall_score}")
-        overall_score_moving_average = await self._moving_average(overall_score, (hotkey, uid))
+        overall_score_moving_average = await self._moving_average(overall_score, (hotkey, uid), score_cache)
 
         return MinerScore(
             id=uuid.uuid4(),
@@ -110,9 +151,9 @@ class MinerScoring:
             task_type=TaskType.COLDKEY_SEARCH
         )
 
-    async def calculate_zero_score(self, batch_id, uid, coldkey, hotkey, error_message):
+    async def calculate_zero_score(self, batch_id, uid, coldkey, hotkey, error_message, score_cache=None):
 
-        overall_score_moving_average = await self._moving_average(0.0, (hotkey, uid))
+        overall_score_moving_average = await self._moving_average(0.0, (hotkey, uid), score_cache)
 
         return MinerScore(
             id=uuid.uuid4(),
@@ -134,18 +175,20 @@ class MinerScoring:
         )
 
 
-def normalize_scores(scores: Dict[int, float]) -> dict[float]:
+def normalize_scores(scores: Dict[int, float]) -> Dict[int, float]:
     """
         Normalize a dictionary of miner Coverage scores to ensure fair comparison.
-        Returns list of Coverage scores normalized between 0-1.
+        Returns dict of Coverage scores normalized between 0-1.
     """
     if not scores:
         return {}
-    
-    min_score = min(scores.values())
-    max_score = max(scores.values())
-    
+
+    values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    min_score = values.min()
+    max_score = values.max()
+
     if min_score == max_score:
-        return [1.0] * len(scores)
-    
-    return {uid: round((score - min_score) / (max_score - min_score), 6) for uid, score in scores.items()}
+        return {uid: 1.0 for uid in scores}
+
+    normalized = np.round((values - min_score) / (max_score - min_score), 6)
+    return dict(zip(scores.keys(), normalized.tolist()))
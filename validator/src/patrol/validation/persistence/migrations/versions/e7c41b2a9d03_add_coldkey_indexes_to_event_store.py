@@ -0,0 +1,30 @@
+"""add_coldkey_indexes_to_event_store
+
+Revision ID: e7c41b2a9d03
+Revises: d5a2a40dd73f
+Create Date: 2025-08-31 10:12:44.171205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c41b2a9d03'
+down_revision: Union[str, None] = 'd5a2a40dd73f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_event_store_coldkey_source", "event_store", ["coldkey_source"])
+    op.create_index("idx_event_store_coldkey_destination", "event_store", ["coldkey_destination"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_event_store_coldkey_source", "event_store")
+    op.drop_index("idx_event_store_coldkey_destination", "event_store")
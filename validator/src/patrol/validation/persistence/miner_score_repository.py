@@ -2,7 +2,7 @@ from patrol.validation import TaskType
 from patrol.validation.scoring import MinerScoreRepository, MinerScore
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession
 from sqlalchemy.orm import mapped_column, Mapped, MappedAsDataclass
-from sqlalchemy import DateTime, select, func
+from sqlalchemy import DateTime, select, func, tuple_
 from datetime import datetime, UTC
 from patrol.validation.persistence import Base
 import uuid
@@ -114,6 +114,32 @@ class DatabaseMinerScoreRepository(MinerScoreRepository):
             result = await session.scalars(query)
             return result.all()
 
+    async def find_latest_overall_scores_bulk(
+            self, miners: Iterable[tuple[str, int]], task_type: TaskType, batch_count: int = 19
+    ) -> dict[tuple[str, int], list[float]]:
+
+        miners = list(miners)
+        if not miners:
+            return {}
+
+        async with self.LocalAsyncSession() as session:
+
+            ranked = select(
+                _MinerScore.overall_score,
+                _MinerScore.hotkey,
+                _MinerScore.uid,
+                func.row_number().over(partition_by=[_MinerScore.hotkey, _MinerScore.uid], order_by=_MinerScore.created_at.desc()).label("rnk")
+            ).where(
+                _MinerScore.task_type == task_type.name,
+                tuple_(_MinerScore.hotkey, _MinerScore.uid).in_(miners)
+            ).subquery()
+
+            results = await session.execute(select(ranked).filter(ranked.c.rnk <= batch_count).order_by(ranked.c.rnk))
+            scores: dict[tuple[str, int], list[float]] = {miner: [] for miner in miners}
+            for it in results.mappings():
+                scores[(it['hotkey'], it['uid'])].append(it['overall_score'])
+            return scores
+
     async def find_last_average_overall_scores(self, task_type: TaskType) -> dict[tuple[str, int], float]:
 
         async with self.LocalAsyncSession() as session:
@@ -49,6 +49,12 @@ class MinerScoreRepository(ABC):
     async def find_latest_overall_scores(self, miner: tuple[str, int], task_type: TaskType, batch_count: int = 19) -> Iterable[float]:
         pass
 
+    @abstractmethod
+    async def find_latest_overall_scores_bulk(
+            self, miners: Iterable[tuple[str, int]], task_type: TaskType, batch_count: int = 19
+    ) -> dict[tuple[str, int], list[float]]:
+        pass
+
     @abstractmethod
     async def find_last_average_overall_scores(self, task_type: TaskType) -> dict[tuple[str, int], float]:
         pass
@@ -38,7 +38,8 @@ async def test_ownership_batch_challenges_miners():
     batch_id = await batch.challenge_miners()
 
     assert len(challenge.execute_challenge.mock_calls) == 2
+    score_cache = challenge.prefetch_previous_scores.return_value
     challenge.execute_challenge.assert_has_awaits([
-        call(Miner(axons[0], 0), "alice", batch_id, 4_999_990),
-        call(Miner(axons[2], 2), "bob", batch_id, 4_999_990)],
+        call(Miner(axons[0], 0), "alice", batch_id, 4_999_990, score_cache=score_cache),
+        call(Miner(axons[2], 2), "bob", batch_id, 4_999_990, score_cache=score_cache)],
         any_order=True)
\ No newline at end of file
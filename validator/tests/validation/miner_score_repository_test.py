@@ -188,6 +188,25 @@ async def test_find_latest_overall_scores_when_none_present(clean_pgsql_engine):
     overall_scores = await repository.find_latest_overall_scores(("ghijkl", 42), TaskType.COLDKEY_SEARCH, 2)
     assert overall_scores == []
 
+async def test_find_latest_overall_scores_bulk(clean_pgsql_engine):
+    now = datetime.now(UTC)
+    repository = DatabaseMinerScoreRepository(clean_pgsql_engine)
+    for i in range(3):
+        await repository.add(make_miner_score(
+            uuid.uuid4(), uuid.uuid4(), created_at=now - timedelta(minutes=i),
+            miner=("abc", 1), overall_score=float(i)))
+    await repository.add(make_miner_score(
+        uuid.uuid4(), uuid.uuid4(), created_at=now, miner=("def", 2), overall_score=7.0))
+
+    scores = await repository.find_latest_overall_scores_bulk(
+        [("abc", 1), ("def", 2), ("ghi", 3)], TaskType.COLDKEY_SEARCH, 2
+    )
+    assert scores == {
+        ("abc", 1): [0.0, 1.0],
+        ("def", 2): [7.0],
+        ("ghi", 3): [],
+    }
+
 async def test_find_last_average_overall_scores(clean_pgsql_engine):
     batch_id = uuid.uuid4()
     now = datetime.now(UTC)
@@ -60,7 +60,7 @@ def test_normalize_scores_empty():
 
 def test_normalize_scores_same_values():
     scores = {1: 0.5, 2: 0.5}
-    assert normalize_scores(scores) == [1.0, 1.0]
+    assert normalize_scores(scores) == {1: 1.0, 2: 1.0}
 
 def test_normalize_scores_varied_values():
     scores = {1: 0.2, 2: 0.5, 3: 0.8}